@@ -1,11 +1,16 @@
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Mapping, Optional
 from backend.logging_setup import logger
+from backend.config.cdp_agent import init_cdp_agent
+from backend.ai.extractors.x402_extractor import extract_x402_parameters
 
 #=======================================================
 async def get_wallet_balance_cdp(user_id: str) -> str:
     """
     Fetch the wallet balance for a given user.
     """
-    from backend.config.cdp_agent import init_cdp_agent
     agent = await init_cdp_agent(user_id)
     if not agent:
         return "❌ Unable to initialize wallet"
@@ -29,7 +34,6 @@ async def get_wallet_address_cdp(user_id: str) -> str:
     """
     Fetch the wallet address for a given user.
     """
-    from backend.config.cdp_agent import init_cdp_agent
     agent = await init_cdp_agent(user_id)
     if not agent:
         return "❌ Unable to initialize wallet"
@@ -48,7 +52,6 @@ async def send_tokens_cdp(user_id: str, params: dict) -> str:
     params: {'amount': float, 'token': 'ETH', 'recipient': '0x...'}
     Returns transaction hash or error string.
     """
-    from backend.config.cdp_agent import init_cdp_agent
     agent = await init_cdp_agent(user_id)
     if not agent:
         raise Exception("Failed to initialize CDP agent")
@@ -93,35 +96,47 @@ pending_transfers = {}
 
 
 # ---------- X402 ----------
-def get_service_info(service: str) -> dict:
-    return {
-        "api_access": {
-            "name": "Premium API Access",
-            "recipient_address": "0x742d35Cc6634C0532925a3b8D4C9db96590c6C87",
-        },
-        "data_feed": {
-            "name": "Real-time Data Feed",
-            "recipient_address": "0x8ba1f109551bD432803012645E136c22C501e5b5",
-        },
-        "oracle_query": {
-            "name": "Oracle Query Service",
-            "recipient_address": "0x1a5F9352Af8Af974bFC03399e3767DF6370d82e4",
-        },
-    }.get(service)
+# Read-only lookup tables, built once at import
+_X402_SERVICES = MappingProxyType({
+    "api_access": MappingProxyType({
+        "name": "Premium API Access",
+        "recipient_address": "0x742d35Cc6634C0532925a3b8D4C9db96590c6C87",
+    }),
+    "data_feed": MappingProxyType({
+        "name": "Real-time Data Feed",
+        "recipient_address": "0x8ba1f109551bD432803012645E136c22C501e5b5",
+    }),
+    "oracle_query": MappingProxyType({
+        "name": "Oracle Query Service",
+        "recipient_address": "0x1a5F9352Af8Af974bFC03399e3767DF6370d82e4",
+    }),
+})
+
+# Basic typo checking for common service names
+_SERVICE_CORRECTIONS = MappingProxyType({
+    "api": "api_access",
+    "data": "data_feed",
+    "oracle": "oracle_query",
+    "feed": "data_feed"
+})
+
+_VALID_TOKENS = ("ETH", "USDC", "USDT", "DAI")
+
+
+def get_service_info(service: str) -> Optional[Mapping[str, str]]:
+    return _X402_SERVICES.get(service)
 
 
 async def process_x402_request(query: str, user_id: str) -> str:
-    from backend.config.cdp_agent import init_cdp_agent
-    from backend.ai.extractors import extract_x402_parameters
     q = query.lower().strip()
 
     ##ADD TYPO CHECKING
     
     if user_id in pending_payments:
         # Check if pending payment has expired
-        import time
         payment_data = pending_payments[user_id]
-        if time.time() > payment_data.get("expires_at", 0):
+        now = time.time()
+        if now > payment_data.get("expires_at", 0):
             del pending_payments[user_id]
             return "⏰ Your previous payment request has expired. Please make a new request."
         
@@ -141,11 +156,12 @@ async def process_x402_request(query: str, user_id: str) -> str:
             del pending_payments[user_id]
             return "❌ Payment cancelled."
         else:
-            remaining_time = int(payment_data.get("expires_at", 0) - time.time())
+            remaining_time = int(payment_data.get("expires_at", 0) - now)
             return f"🤔 You have a pending payment (expires in {remaining_time}s). Reply 'confirm payment' or 'cancel'."
 
     try:
-        params = extract_x402_parameters(query)
+        # Blocking LLM call, keep it off the event loop
+        params = await asyncio.to_thread(extract_x402_parameters, query)
         service, amount, token = params["service"], params["amount"], params.get("token", "ETH")
         
         # Validate extracted parameters
@@ -165,36 +181,28 @@ async def process_x402_request(query: str, user_id: str) -> str:
         except (ValueError, TypeError):
             return "❌ Invalid payment amount. Please specify a valid number."
         
-        # Basic typo checking for common service names
-        service_corrections = {
-            "api": "api_access",
-            "data": "data_feed", 
-            "oracle": "oracle_query",
-            "feed": "data_feed"
-        }
-        if service in service_corrections:
-            service = service_corrections[service]
+        service = _SERVICE_CORRECTIONS.get(service, service)
         
         info = get_service_info(service)
         if not info:
             return f"⚠️ Service '{service}' not found. Available services: api_access, data_feed, oracle_query"
         
         # Validate token symbol
-        valid_tokens = ["ETH", "USDC", "USDT", "DAI"]
-        if token.upper() not in valid_tokens:
-            return f"❌ Unsupported token '{token}'. Supported tokens: {', '.join(valid_tokens)}"
+        token_symbol = token.upper()
+        if token_symbol not in _VALID_TOKENS:
+            return f"❌ Unsupported token '{token}'. Supported tokens: {', '.join(_VALID_TOKENS)}"
         
         # Store validated parameters with timeout (5 minutes from now)
-        import time
+        now = time.time()
         pending_payments[user_id] = {
             "service_id": service,
             "amount": amount_float,
-            "token": token.upper(),
+            "token": token_symbol,
             "to_address": info["recipient_address"],
-            "created_at": time.time(),
-            "expires_at": time.time() + 300  # 5 minutes timeout
+            "created_at": now,
+            "expires_at": now + 300  # 5 minutes timeout
         }
-        return f"🔍 Confirm {amount_float} {token.upper()} for {info['name']} → {info['recipient_address']}"
+        return f"🔍 Confirm {amount_float} {token_symbol} for {info['name']} → {info['recipient_address']}"
     except Exception as e:
         logger.error(f"x402 flow failed: {e}")
         return "❌ Could not process x402 request."
@@ -202,6 +210,5 @@ async def process_x402_request(query: str, user_id: str) -> str:
 #=======================================================
 
 async def get_token_price(symbol: str) -> float:
-    from backend.config.cdp_agent import init_cdp_agent
     agent = await init_cdp_agent("oracle_user")
     return agent.pyth.get_price(symbol)
@@ -5,29 +5,40 @@ Vector database operations with error handling and connection management.
 from dotenv import load_dotenv
 load_dotenv()
 from backend.config.settings import pinecone_settings
-from backend.utils.embedding import get_embedding
+from backend.utils.embedding import get_embedding_list
 
 from pinecone import Pinecone
 from typing import List, Any
 from backend.logging_setup import logger
+import functools
 
 
 
 
+@functools.lru_cache(maxsize=1)
+def get_pinecone_client() -> Pinecone:
+    """Initialize the Pinecone client once per process."""
+    logger.info("Initializing Pinecone client...")
+    return Pinecone(api_key=pinecone_settings.PINECONE_API_KEY)
+
+@functools.lru_cache(maxsize=1)
 def get_pinecone_index():
-    """Initialize and return Pinecone index."""
+    """Initialize and return Pinecone index (cached after the first successful call)."""
     try:
-        logger.info("Initializing Pinecone client...")
-        pc = Pinecone(api_key=pinecone_settings.PINECONE_API_KEY)
-        index = pc.Index(pinecone_settings.PINECONE_INDEX)
+        index = get_pinecone_client().Index(pinecone_settings.PINECONE_INDEX)
         logger.info(f"Connected to Pinecone index: {pinecone_settings.PINECONE_INDEX}")
         return index
     except Exception as e:
         logger.exception("Failed to initialize Pinecone")
         raise RuntimeError(f"Could not initialize Pinecone: {e}")
     
-def query_vector_db(embedding: List[float], top_k: int = 5) -> List[Any]:
-    """Query vector database with error handling."""
+def query_vector_db(
+    embedding: List[float],
+    top_k: int = 5,
+    include_metadata: bool = False,
+    include_values: bool = False,
+) -> List[Any]:
+    """Query vector database with error handling. Metadata/values are only fetched when asked for."""
     if not embedding:
         raise ValueError("Embedding cannot be empty")
 
@@ -36,7 +47,12 @@ def query_vector_db(embedding: List[float], top_k: int = 5) -> List[Any]:
 
     try:
         index = get_pinecone_index()
-        response = index.query(vector=embedding, top_k=top_k)
+        response = index.query(
+            vector=embedding,
+            top_k=top_k,
+            include_metadata=include_metadata,
+            include_values=include_values,
+        )
         return response.matches
     except Exception as e:
         logger.error(f"Vector database query failed: {e}")
@@ -48,8 +64,9 @@ def db_query_chain(query: str) -> dict:
         raise ValueError("Query must be non-empty and less than 1000 characters")
 
     try:
-        embedding = get_embedding(query)
-        results = query_vector_db(embedding, top_k=1)
+        embedding = get_embedding_list(query)
+        # The answer text lives in match metadata
+        results = query_vector_db(embedding, top_k=1, include_metadata=True)
         if not results:
             return {"answer": "No relevant information found.", "confidence": 0.0}
 
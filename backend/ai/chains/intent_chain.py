@@ -1,3 +1,4 @@
+import functools
 from langchain.prompts import ChatPromptTemplate
 from langsmith import traceable
 from backend.models.schemas import IntentType, IntentClassificationResult
@@ -22,8 +23,36 @@ Respond with ONLY one label: general_query, action_intent, or clarification.
 Label:"""
 )
 
+# Map AI response to correct enum values
+_INTENT_MAPPING = {
+    "general_query": IntentType.GENERAL_QUERY,
+    "action_intent": IntentType.ACTION_REQUEST,  # Map action_intent to ACTION_REQUEST
+    "clarification": IntentType.CLARIFICATION
+}
 
 
+class _UnusableIntentResponse(Exception):
+    """Raised instead of returning so empty or unknown model output is never cached."""
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_label(query: str) -> IntentType:
+    """
+    Ask the intent model for a label. Repeated queries are served from the LRU.
+    """
+    intent_model = _get_intent_model()
+    msg = _intent_prompt.format_messages(query=query)
+    out = intent_model.invoke(msg)
+    if not out or not out.content:
+        raise _UnusableIntentResponse("Empty response from intent classification model")
+
+    # Validate and map to enum
+    raw_intent = out.content.strip().lower()
+    intent = _INTENT_MAPPING.get(raw_intent)
+    if intent is None:
+        raise _UnusableIntentResponse(f"Invalid intent classification: {raw_intent}")
+    return intent
+
 
 @traceable(name="DeFi Intent Classification")
 def classify_intent(query: str) -> str:
@@ -53,39 +82,18 @@ def classify_intent_detailed(query: str) -> IntentClassificationResult:
     
     try:
         # Run the model with timeout protection
-        intent_model = _get_intent_model()
-        msg = _intent_prompt.format_messages(query=query.strip())
-        out = intent_model.invoke(msg)
-        
-        if not out or not out.content:
-            logger.warning("Empty response from intent classification model")
-            return IntentClassificationResult(
-                intent=IntentType.CLARIFICATION
-            )
-        
-        raw_intent = out.content.strip().lower()
-        
-        # Map AI response to correct enum values
-        intent_mapping = {
-            "general_query": IntentType.GENERAL_QUERY,
-            "action_intent": IntentType.ACTION_REQUEST,  # Map action_intent to ACTION_REQUEST
-            "clarification": IntentType.CLARIFICATION
-        }
-        
-        # Validate and map to enum
-        if raw_intent in intent_mapping:
-            intent = intent_mapping[raw_intent]
-            confidence = 0.9  # High confidence for valid classifications
-        else:
-            # Fallback to clarification if invalid
-            logger.warning(f"Invalid intent classification: {raw_intent}")
-            intent = IntentType.CLARIFICATION
-            confidence = 0.3  # Low confidence for fallback
+        intent = _classify_label(query.strip())
         
         return IntentClassificationResult(
             intent=intent
         )
         
+    except _UnusableIntentResponse as e:
+        # Fallback to clarification if empty or invalid
+        logger.warning(str(e))
+        return IntentClassificationResult(
+            intent=IntentType.CLARIFICATION
+        )
     except Exception as e:
         logger.error(f"Intent classification error: {e}")
         return IntentClassificationResult(
@@ -3,13 +3,13 @@ DeFi Action Engine built on Coinbase AgentKit.
 Handles transfers, balances, x402 payments, price queries, and APY lookups.
 """
 
+import asyncio
 from backend.logging_setup import logger
 from langchain.prompts import ChatPromptTemplate
 from langsmith import traceable
 from backend.utils.model_selector import tiny_model
 from backend.ai.extractors.transfer_extractor import extract_transfer_parameters
 from backend.ai.extractors.price_extractor import extract_price_parameters
-from backend.ai.extractors.balance_extractor import extract_balance_parameters
 from backend.utils.apy import get_top_low_yield_apy_pools
 from backend.ai.extractors.x402_extractor import extract_x402_parameters
 
@@ -59,8 +59,8 @@ async def run_action_chain(query: str, user_id: str) -> str:
     )
     from backend.utils.apy import get_top_low_yield_apy_pools
 
-    msg = _action_sub_intent_prompt.format_messages(query=query.strip())
-    intent = classify_action_sub_intent(query)
+    # Classifier, extractors and the APY fetch are blocking; keep them off the event loop
+    intent = await asyncio.to_thread(classify_action_sub_intent, query)
 
     if intent == "check_balance":
         return await get_wallet_balance_cdp(user_id)
@@ -70,7 +70,7 @@ async def run_action_chain(query: str, user_id: str) -> str:
 
     elif intent == "send_tokens":
         try:
-            params = extract_transfer_parameters(query)
+            params = await asyncio.to_thread(extract_transfer_parameters, query)
             return await send_tokens_cdp(user_id, params)
         except Exception as e:
             logger.error(f"Transfer extraction failed: {e}")
@@ -81,7 +81,7 @@ async def run_action_chain(query: str, user_id: str) -> str:
 
     elif intent == "get_price":
         try:
-            params = extract_price_parameters(query)
+            params = await asyncio.to_thread(extract_price_parameters, query)
             price = await get_token_price(params["symbol"])
             return f"💲 Current price of {params['symbol'].upper()}: ${price:.4f}"
         except Exception as e:
@@ -93,12 +93,11 @@ async def run_action_chain(query: str, user_id: str) -> str:
 
     elif intent == "search_apy":
         try:
-            params = extract_balance_parameters(query)
-            pools = get_top_low_yield_apy_pools(params.get("top", 3), highest=True)
-            if not pools:
+            pools = await asyncio.to_thread(get_top_low_yield_apy_pools)
+            if not pools or "error" in pools[0]:
                 return "❌ No high APY pools found."
             response = "🏆 Top APY Pools:\n" + "\n".join(
-                [f"- {p['name']}: {p['apy']}% ({p['link']})" for p in pools]
+                [f"- {p['protocol']} {p['coinpair']} ({p['chain']}): {p['apy_percentage']}%" for p in pools]
             )
             return response
         except Exception as e:
@@ -1,3 +1,4 @@
+import json
 from backend.utils.model_selector import mini_model
 from backend.logging_setup import logger
 from langchain.prompts import ChatPromptTemplate
@@ -24,7 +25,6 @@ def extract_balance_parameters(query: str) -> dict:
             logger.warning("Empty response from balance extraction model")
             return {"tokens": "all"}
         # Simple parsing assuming well-formed JSON response
-        import json
         return json.loads(out.content)
     except Exception as e:
         logger.error(f"Balance extraction error: {e}")
@@ -3,6 +3,7 @@ from backend.logging_setup import logger
 from langchain.prompts import ChatPromptTemplate
 from langsmith import traceable
 import json
+from types import MappingProxyType
 
 # Updated prompt to explicitly return null for missing fields
 transfer_extraction_prompt = ChatPromptTemplate.from_template(
@@ -16,15 +17,15 @@ transfer_extraction_prompt = ChatPromptTemplate.from_template(
     """
 )
 
+# Default response with None for missing values
+_DEFAULT_RESPONSE = MappingProxyType({"amount": None, "token": None, "recipient": None})
+
 @traceable(name="Transfer Extraction")
 def extract_transfer_parameters(query: str) -> dict:
     """
     Extract parameters for token transfer from user query.
     Returns None for missing parameters.
     """
-    # Define a default response with None for missing values
-    default_response = {"amount": None, "token": None, "recipient": None}
-    
     try:
         model = mini_model()
         msg = transfer_extraction_prompt.format_messages(query=query.strip())
@@ -32,12 +33,12 @@ def extract_transfer_parameters(query: str) -> dict:
         
         if not out or not out.content:
             logger.warning("Empty response from transfer extraction model")
-            return default_response
+            return dict(_DEFAULT_RESPONSE)
             
         extracted_data = json.loads(out.content)
         # Merge extracted data with defaults to ensure all keys exist
-        return {**default_response, **extracted_data}
+        return {**_DEFAULT_RESPONSE, **extracted_data}
         
     except Exception as e:
         logger.error(f"Transfer extraction error: {e}")
-        return default_response
\ No newline at end of file
+        return dict(_DEFAULT_RESPONSE)
\ No newline at end of file
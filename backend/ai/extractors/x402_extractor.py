@@ -1,4 +1,5 @@
 import json
+from types import MappingProxyType
 from backend.utils.model_selector import mini_model
 from backend.logging_setup import logger
 from langchain.prompts import ChatPromptTemplate
@@ -19,19 +20,19 @@ Return a JSON object with the following fields:
 """
 )
 
+# Default response structure for error handling and consistency.
+_DEFAULT_RESPONSE = MappingProxyType({
+    "service": "generic_service",
+    "amount": None,
+    "token": "ETH",
+    "recipient": None
+})
+
 @traceable(name="X402 Parameter Extraction")
 def extract_x402_parameters(query: str) -> dict:
     """
     Extracts x402 payment parameters from a user query using a language model.
     """
-    # Define a default response structure for error handling and consistency.
-    default_response = {
-        "service": "generic_service",
-        "amount": None,
-        "token": "ETH",
-        "recipient": None
-    }
-    
     try:
         # Initialize the language model.
         model = mini_model()
@@ -45,20 +46,20 @@ def extract_x402_parameters(query: str) -> dict:
         # Validate the model's response.
         if not model_output or not model_output.content:
             logger.warning("Empty response from x402 extraction model for query: '%s'", query)
-            return default_response
+            return dict(_DEFAULT_RESPONSE)
             
         # Parse the JSON string from the model's content.
         extracted_data = json.loads(model_output.content)
         
         # Ensure the response contains expected keys, merging with defaults.
-        return {**default_response, **extracted_data}
+        return {**_DEFAULT_RESPONSE, **extracted_data}
 
     except json.JSONDecodeError as e:
         logger.error(
             "JSON parsing failed for x402 extraction. Raw model output: %s. Error: %s",
             getattr(model_output, 'content', 'N/A'), e
         )
-        return default_response
+        return dict(_DEFAULT_RESPONSE)
     except Exception as e:
         logger.error("An unexpected error occurred during x402 extraction: %s", e)
-        return default_response
\ No newline at end of file
+        return dict(_DEFAULT_RESPONSE)
\ No newline at end of file
@@ -57,7 +57,7 @@ async def init_cdp_agent(user_id: str, wallet_info=None):
                 return None
 
         # 🔹 Decrypt developer wallet secret
-        owner_key = crypto.decrypt(wallet_info["encrypted_wallet_secret"])
+        owner_key = crypto.decrypt(wallet_info.encrypted_wallet_secret)
         logger.info(f"Decrypted wallet secret (truncated): {owner_key[:10]}...")
 
         # 🔹 Configure SmartWalletProvider
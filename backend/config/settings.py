@@ -71,6 +71,16 @@ class VectorSettings(BaseSettings):
         env_file = ".env"
 
 
+class EmbeddingSettings(BaseSettings):
+    # Half precision shifts similarity scores slightly; keep fp32 unless the
+    # confidence thresholds have been re-checked against the index
+    EMBEDDING_HALF_PRECISION: bool = False
+    TORCH_COMPILE_EMBED: bool = False
+
+    class Config:
+        env_file = ".env"
+
+
 class SessionSettings(BaseSettings):
     SESSION_TTL: int = 300
     MAX_CONVERSATION_HISTORY: int = 10
@@ -103,6 +113,7 @@ redis_settings = RedisSettings()
 model_settings = ModelSettings()
 security_settings = SecuritySettings()
 vector_settings = VectorSettings()
+embedding_settings = EmbeddingSettings()
 session_settings = SessionSettings()
 chatbot_settings = ChatBot()
 langchain_settings = LangChainSettings()
@@ -15,6 +15,8 @@ def setup_logger(name: str = "app"):
         return logger
 
     logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    # Our own handlers below; don't re-emit through uvicorn's root config
+    logger.propagate = False
 
     formatter = logging.Formatter(
         '[%(asctime)s] %(levelname)s [%(name)s:%(filename)s:%(lineno)d] - %(message)s'
@@ -22,6 +22,7 @@ from backend.middleware.langsmith_tracer import LangSmithTracerMiddleware
 from backend.middleware.log_requests import log_requests
 from backend.config.settings import langchain_settings, security_settings
 from backend.routes import query
+from backend.utils.embedding import warmup as warmup_embeddings
 
 # Rate limiter setup
 limiter = Limiter(key_func=get_remote_address)
@@ -58,6 +59,13 @@ app.middleware("http")(log_requests)
 app.add_middleware(LangSmithTracerMiddleware)
 
 
+# Load ML models before serving traffic
+@app.on_event("startup")
+async def warmup_models():
+    """Warm up the embedding model off the event loop"""
+    await asyncio.to_thread(warmup_embeddings)
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
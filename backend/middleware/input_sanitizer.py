@@ -21,8 +21,10 @@ SUSPICIOUS_PATTERNS = [
     r'\$\{.*\}',  # Variable injection
 ]
 
-# Compile patterns for better performance
-COMPILED_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in SUSPICIOUS_PATTERNS]
+# Compile patterns for better performance, fused into one alternation
+# so the input is scanned in a single pass
+SUSPICIOUS_RE = re.compile("|".join(f"(?:{pattern})" for pattern in SUSPICIOUS_PATTERNS), re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
 
 def sanitize_text_input(text: str, max_length: int = 1000) -> str:
     """
@@ -49,16 +51,15 @@ def sanitize_text_input(text: str, max_length: int = 1000) -> str:
         )
     
     # Check for suspicious patterns
-    for pattern in COMPILED_PATTERNS:
-        if pattern.search(text):
-            logger.warning(f"Suspicious input detected: {text[:100]}...")
-            raise HTTPException(
-                status_code=400,
-                detail="Input contains potentially malicious content."
-            )
+    if SUSPICIOUS_RE.search(text):
+        logger.warning(f"Suspicious input detected: {text[:100]}...")
+        raise HTTPException(
+            status_code=400,
+            detail="Input contains potentially malicious content."
+        )
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = WHITESPACE_RE.sub(' ', text.strip())
     
     # Remove null bytes and control characters
     text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\t')
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Request, Response
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -38,12 +39,12 @@ async def handle_query(   # 🔹 changed to async
     client_ip = get_remote_address(request)
     user_agent = request.headers.get("user-agent", "unknown")
 
-    # 🔹 Top-level intent classification
-    intent = classify_intent(query_text)
+    # 🔹 Top-level intent classification (blocking LLM call, keep it off the event loop)
+    intent = await asyncio.to_thread(classify_intent, query_text)
 
     if intent == "general_query":
         try:
-            answer = general_query_chain(query_text)  # sync, keep as is
+            answer = await asyncio.to_thread(general_query_chain, query_text)  # sync chain
             return QueryResponse(answer=answer)
         except Exception as e:
             logger.error(f"Error processing general query: {e}")
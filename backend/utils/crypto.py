@@ -1,3 +1,7 @@
+import base64
+import binascii
+
+
 def encrypt(data: str) -> str:
     """
     Encrypt wallet data for storage.
@@ -11,13 +15,10 @@ def encrypt(data: str) -> str:
     Returns:
         Encrypted data string
     """
-    import base64
     # In production, use proper encryption like AES
     # For demo purposes, just base64 encode
     return base64.b64encode(data.encode()).decode()
 
-import base64
-import binascii
 
 def decrypt(encrypted_data: str) -> str:
     """
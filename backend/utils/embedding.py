@@ -3,13 +3,28 @@ Embedding service with lazy loading and error handling.
 """
 from sentence_transformers import SentenceTransformer
 from backend.logging_setup import logger
+from backend.config.settings import embedding_settings
 from typing import List, Optional
 import functools
+import numpy as np
+import torch
 
 
 # Global model instance (lazy loaded)
 _model: Optional[SentenceTransformer] = None
 
+def _select_dtype() -> torch.dtype:
+    """Pick the narrowest dtype the current hardware runs natively, if half precision is enabled."""
+    if not embedding_settings.EMBEDDING_HALF_PRECISION:
+        return torch.float32
+    if torch.cuda.is_available():
+        return torch.float16
+    # Private helper, only present on recent torch builds
+    is_bf16_supported = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+    if is_bf16_supported is not None and is_bf16_supported():
+        return torch.bfloat16
+    return torch.float32
+
 @functools.lru_cache(maxsize=1)
 def get_embedding_model() -> SentenceTransformer:
     """Get embedding model with lazy loading and caching."""
@@ -17,30 +32,54 @@ def get_embedding_model() -> SentenceTransformer:
     if _model is None:
         try:
             logger.info("Loading embedding model...")
-            _model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-            logger.info("Embedding model loaded successfully")
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            dtype = _select_dtype()
+            _model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2", device=device)
+            if dtype != torch.float32:
+                _model = _model.to(dtype)
+            if embedding_settings.TORCH_COMPILE_EMBED:
+                # Compilation happens on the first encode, i.e. inside warmup().
+                # dynamic=True so each new padded query length doesn't recompile;
+                # no CUDA graphs, since those are recorded per shape and per thread
+                # and encode runs on to_thread workers.
+                _model[0].auto_model = torch.compile(
+                    _model[0].auto_model, mode="default", fullgraph=False, dynamic=True
+                )
+            logger.info(f"Embedding model loaded successfully ({device}, {dtype})")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             raise RuntimeError(f"Could not load embedding model: {e}")
     return _model
 
-def get_embedding(text: str) -> List[float]:
-    """Generate embedding vector for a text query with error handling."""
+def get_embedding(text: str) -> np.ndarray:
+    """Generate a normalized float32 embedding vector for a text query with error handling."""
     if not text or not text.strip():
         raise ValueError("Text cannot be empty")
     
     try:
         model = get_embedding_model()
-        embedding = model.encode(text.strip()).tolist()
-        return embedding
+        # Stay in tensor form so half-precision output never goes through numpy
+        embedding = model.encode(text.strip(), convert_to_tensor=True, normalize_embeddings=True)
+        return embedding.float().cpu().numpy()
     except Exception as e:
         logger.error(f"Failed to generate embedding for text: {e}")
         raise RuntimeError(f"Embedding generation failed: {e}")
 
-import logging
-from backend.utils.embedding import get_embedding_model
+def get_embedding_list(text: str) -> List[float]:
+    """Generate embedding as a plain list, for callers that serialize it (e.g. Pinecone)."""
+    return get_embedding(text).tolist()
 
-logger = logging.getLogger(__name__)
+def warmup() -> None:
+    """Load the embedding model and run throwaway encodes so the first request doesn't pay for it."""
+    try:
+        model = get_embedding_model()
+        # Same shape as get_embedding(): one string per call, at two different
+        # lengths so a compiled encoder builds its dynamic-shape graph here
+        for text in ("warmup", "warmup query with a few more tokens than the first one"):
+            model.encode(text, convert_to_tensor=True, normalize_embeddings=True)
+        logger.info("Embedding model warmed up")
+    except Exception as e:
+        logger.warning(f"Embedding warmup failed, will load on first request: {e}")
 
 def health_check() -> bool:
     """Check if embedding model is available. Never crash."""
@@ -53,4 +92,3 @@ def health_check() -> bool:
     except Exception as e:
         logger.warning(f"Embedding health check failed: {e}")
         return False
-
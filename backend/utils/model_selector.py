@@ -10,99 +10,47 @@ from backend.logging_setup import logger
 
 _MODEL_CACHE = {}
 
+def _build_gpt_model(model_name: str):
+    return ChatOpenAI(
+        model_name=model_name,
+        temperature=model_settings.DEFAULT_TEMPERATURE,
+        max_tokens=model_settings.MAX_TOKENS,
+    )
+
+def _build_ollama_model(model_name: str):
+    return Ollama(
+        model=model_name,
+        temperature=model_settings.DEFAULT_TEMPERATURE,
+        max_tokens=model_settings.MAX_TOKENS,
+    )
+
+# Resolve USE_GPT once so the model getters don't branch on every call
+if chatbot_settings.USE_GPT:
+    _build_model, _PROVIDER = _build_gpt_model, "GPT-5 via API"
+    _TINY_MODEL, _MINI_MODEL = "gpt-5-tiny", "gpt-5-mini"
+else:
+    _build_model, _PROVIDER = _build_ollama_model, "Mistral-7B via Ollama"
+    _TINY_MODEL = _MINI_MODEL = "mistral:7b"
+
+def _load_model(model_name: str, role: str):
+    """Return the cached model for model_name, creating it on first use."""
+    if model_name not in _MODEL_CACHE:
+        try:
+            _MODEL_CACHE[model_name] = _build_model(model_name)
+            logger.info(f"Loaded {role} model: {model_name} ({_PROVIDER})")
+        except Exception as e:
+            logger.error(f"Failed to load {role} model {model_name}: {e}")
+            raise
+    return _MODEL_CACHE[model_name]
+
 def get_intent_model():
     """Get intent classification model with fallback handling."""
-    if chatbot_settings.USE_GPT:
-        # Use GPT-5 tiny via API
-        model_name = "gpt-5-tiny"
-        if model_name not in _MODEL_CACHE:
-            try:
-                _MODEL_CACHE[model_name] = ChatOpenAI(
-                    model_name=model_name,
-                    temperature=model_settings.DEFAULT_TEMPERATURE,
-                    max_tokens=model_settings.MAX_TOKENS,
-                )
-                logger.info(f"Loaded intent model: {model_name} (GPT-5 tiny)")
-            except Exception as e:
-                logger.error(f"Failed to load intent model {model_name}: {e}")
-                raise
-        return _MODEL_CACHE[model_name]
-    else:
-        # Use Mistral-7B via Ollama
-        model_name = "mistral:7b"
-        if model_name not in _MODEL_CACHE:
-            try:
-                _MODEL_CACHE[model_name] = Ollama(
-                    model=model_name,
-                    temperature=model_settings.DEFAULT_TEMPERATURE,
-                    max_tokens=model_settings.MAX_TOKENS,
-                )
-                logger.info(f"Loaded intent model: {model_name} (Mistral-7B via Ollama)")
-            except Exception as e:
-                logger.error(f"Failed to load intent model {model_name}: {e}")
-                raise
-        return _MODEL_CACHE[model_name]
+    return _load_model(_TINY_MODEL, "intent")
 
 def tiny_model():
     """Return the appropriate tiny model (GPT-5 Tiny or Mistral-7B via Ollama)."""
-    if chatbot_settings.USE_GPT:
-        model_name = "gpt-5-tiny"
-        if model_name not in _MODEL_CACHE:
-            try:
-                _MODEL_CACHE[model_name] = ChatOpenAI(
-                    model_name=model_name,
-                    temperature=model_settings.DEFAULT_TEMPERATURE,
-                    max_tokens=model_settings.MAX_TOKENS,
-                )
-                logger.info(f"Loaded tiny model: {model_name} (GPT-5 Tiny)")
-            except Exception as e:
-                logger.error(f"Failed to load tiny model {model_name}: {e}")
-                raise
-        return _MODEL_CACHE[model_name]
-
-    else:
-        model_name = "mistral:7b"
-        if model_name not in _MODEL_CACHE:
-            try:
-                _MODEL_CACHE[model_name] = Ollama(
-                    model=model_name,
-                    temperature=model_settings.DEFAULT_TEMPERATURE,
-                    max_tokens=model_settings.MAX_TOKENS,
-                )
-                logger.info(f"Loaded tiny model: {model_name} (Mistral-7B via Ollama)")
-            except Exception as e:
-                logger.error(f"Failed to load tiny model {model_name}: {e}")
-                raise
-        return _MODEL_CACHE[model_name]
+    return _load_model(_TINY_MODEL, "tiny")
 
 def mini_model():
     """Return the appropriate mini model (GPT-5 Mini or Mistral-7B via Ollama)."""
-    if chatbot_settings.USE_GPT:
-        model_name = "gpt-5-mini"
-        if model_name not in _MODEL_CACHE:
-            try:
-                _MODEL_CACHE[model_name] = ChatOpenAI(
-                    model_name=model_name,
-                    temperature=model_settings.DEFAULT_TEMPERATURE,
-                    max_tokens=model_settings.MAX_TOKENS,
-                )
-                logger.info(f"Loaded mini model: {model_name} (GPT-5 Mini)")
-            except Exception as e:
-                logger.error(f"Failed to load mini model {model_name}: {e}")
-                raise
-        return _MODEL_CACHE[model_name]
-    else:
-        model_name = "mistral:7b"
-        if model_name not in _MODEL_CACHE:
-            try:
-                _MODEL_CACHE[model_name] = Ollama(
-                    model=model_name,
-                    temperature=model_settings.DEFAULT_TEMPERATURE,
-                    max_tokens=model_settings.MAX_TOKENS,
-                )
-                logger.info(f"Loaded mini model: {model_name} (Mistral-7B via Ollama)")
-            except Exception as e:
-                logger.error(f"Failed to load mini model {model_name}: {e}")
-                raise
-        return _MODEL_CACHE[model_name]
-    
+    return _load_model(_MINI_MODEL, "mini")